@@ -18,14 +18,47 @@ Five Assessment Tasks (from paper):
 Target: ~612 initial records (manually collected papers for journal submission)
 """
 
+import ahocorasick
+import orjson
 import requests
-import pandas as pd
+from requests.adapters import HTTPAdapter
+from requests_cache import CachedSession
+from urllib3.util.retry import Retry
 from pathlib import Path
-import json
+import csv
+import threading
 import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
 from typing import Optional, Dict
 
 
+class PacedHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that bounds in-flight requests and spaces their starts evenly.
+    
+    Pacing lives in send() so that only real network requests are throttled;
+    a CachedSession answers cache hits without reaching the adapter.
+    """
+    
+    def __init__(self, max_concurrent: int, max_per_second: float, **kwargs):
+        super().__init__(**kwargs)
+        self._slots = threading.Semaphore(max_concurrent)
+        self._interval = 1.0 / max_per_second
+        self._lock = threading.Lock()
+        self._next_send_at = 0.0
+    
+    def send(self, request, **kwargs):
+        with self._slots:
+            with self._lock:
+                now = time.monotonic()
+                start = max(now, self._next_send_at)
+                self._next_send_at = start + self._interval
+            if start > now:
+                time.sleep(start - now)
+            return super().send(request, **kwargs)
+
+
 class RestrictedPaperSearcher:
     """STRICTLY restricted search aligned with the paper's five assessment tasks."""
     
@@ -130,6 +163,15 @@ class RestrictedPaperSearcher:
     ALL_ASSESSMENT_TASKS = (TASK_GEOMETRY + TASK_STRENGTH + 
                            TASK_DETERIORATION + TASK_DEFECTS + TASK_MOISTURE)
     
+    # Assessment task keywords by task label (order used in reported tasks)
+    TASK_CATEGORIES = {
+        "geometry": TASK_GEOMETRY,
+        "strength": TASK_STRENGTH,
+        "deterioration": TASK_DETERIORATION,
+        "defects": TASK_DEFECTS,
+        "moisture": TASK_MOISTURE,
+    }
+    
     # Circular economy / reuse focus (STRICT - must be structural reuse)
     CIRCULAR_STRICT = [
         "circular construction", "circular economy building",
@@ -140,6 +182,14 @@ class RestrictedPaperSearcher:
         "reuse assessment", "reusability assessment",
     ]
     
+    # Words counted per material in the PRISMA "by_material" tally
+    MATERIAL_TALLY = {
+        "concrete": ("concrete",),
+        "steel": ("steel",),
+        "timber": ("timber", "wood"),
+        "masonry": ("masonry",),
+    }
+    
     # STRICT exclusion keywords - expanded
     EXCLUSION_STRICT = [
         # Medical/Clinical
@@ -162,56 +212,110 @@ class RestrictedPaperSearcher:
         "pavement", "asphalt", "road surface", "runway",
     ]
     
+    # Brace escapes applied to titles in BibTeX entries
+    BIBTEX_ESCAPES = str.maketrans({"{": "\\{", "}": "\\}"})
+    
+    # OpenAlex polite pool: at most 10 requests per second
+    MAX_REQUESTS_PER_SECOND = 10
+    MAX_CONCURRENT_REQUESTS = 10
+    REQUEST_TIMEOUT = 30
+    # Work fields read by _parse_paper; everything else is left off the wire
+    SELECT_FIELDS = ("id,title,publication_year,doi,authorships,"
+                     "primary_location,cited_by_count,type,open_access,"
+                     "abstract_inverted_index")
+    # On-disk SQLite cache of OpenAlex responses (openalex_cache.sqlite)
+    CACHE_NAME = "openalex_cache"
+    CACHE_EXPIRE_AFTER = timedelta(days=7)
+    
     def __init__(self, email: Optional[str] = None):
         self.base_url = "https://api.openalex.org/works"
         self.email = email
         self.results = []
         self.excluded = []
-        self.exclusion_stats = {}
+        self.exclusion_stats = defaultdict(int)
+        self.session = self._build_session()
+        self.automaton = self._build_automaton()
+    
+    def _build_session(self) -> CachedSession:
+        """Cached, pooled, paced session with retries on rate limits and server errors."""
+        # Responses are cached per full query string, so every cursor page is
+        # reused on re-runs until it expires (or served stale if OpenAlex errors)
+        session = CachedSession(
+            self.CACHE_NAME,
+            backend="sqlite",
+            expire_after=self.CACHE_EXPIRE_AFTER,
+            allowable_methods=["GET"],
+            stale_if_error=True,
+        )
+        retry = Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            respect_retry_after_header=True,
+        )
+        adapter = PacedHTTPAdapter(
+            max_concurrent=self.MAX_CONCURRENT_REQUESTS,
+            max_per_second=self.MAX_REQUESTS_PER_SECOND,
+            pool_connections=self.MAX_CONCURRENT_REQUESTS,
+            pool_maxsize=self.MAX_CONCURRENT_REQUESTS,
+            max_retries=retry,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        
+        user_agent = f"ndt-review ({self.email})" if self.email else "ndt-review"
+        session.headers.update({"User-Agent": user_agent, "Accept-Encoding": "gzip"})
+        return session
+    
+    def _build_automaton(self) -> "ahocorasick.Automaton":
+        """Tag every keyword with its category in one Aho-Corasick automaton."""
+        categories = {
+            "exclude": self.EXCLUSION_STRICT,
+            "ndt": self.NDT_METHODS_CORE,
+            "material": self.STRUCTURAL_MATERIALS,
+            "circular": self.CIRCULAR_STRICT,
+        }
+        categories.update(self.TASK_CATEGORIES)
+        
+        tagged = {}
+        for category, keywords in categories.items():
+            for keyword in keywords:
+                tagged.setdefault(keyword, set()).add(category)
+        
+        automaton = ahocorasick.Automaton()
+        for keyword, cats in tagged.items():
+            automaton.add_word(keyword, (keyword, frozenset(cats)))
+        automaton.make_automaton()
+        return automaton
         
     def is_relevant(self, paper: Dict) -> tuple:
         """STRICT relevance check - must match paper's five assessment tasks."""
-        title = (paper.get("title") or "").lower()
-        abstract = (paper.get("abstract") or "").lower()
-        text = f"{title} {abstract}"
+        text = paper["_text_lc"]
         
-        # Check exclusions first (strict)
-        for exclude in self.EXCLUSION_STRICT:
-            if exclude.lower() in text:
-                reason = f"Excluded: {exclude}"
-                self.exclusion_stats[exclude] = self.exclusion_stats.get(exclude, 0) + 1
+        # Single pass over the text collects every keyword category at once
+        matched = set()
+        for _, (keyword, categories) in self.automaton.iter(text):
+            # Check exclusions first (strict): stop at the first excluded term
+            if "exclude" in categories:
+                reason = f"Excluded: {keyword}"
+                self.exclusion_stats[keyword] += 1
                 return False, reason
+            matched |= categories
         
         # MUST have NDT method mentioned
-        has_ndt = any(m.lower() in text for m in self.NDT_METHODS_CORE)
-        if not has_ndt:
+        if "ndt" not in matched:
             return False, "No core NDT method"
         
         # MUST have structural material mentioned
-        has_material = any(m.lower() in text for m in self.STRUCTURAL_MATERIALS)
-        if not has_material:
+        if "material" not in matched:
             return False, "No structural material"
         
         # MUST have at least one of the five assessment tasks
-        has_task = any(t.lower() in text for t in self.ALL_ASSESSMENT_TASKS)
-        has_circular = any(c.lower() in text for c in self.CIRCULAR_STRICT)
+        tasks_found = [task for task in self.TASK_CATEGORIES if task in matched]
         
-        if not (has_task or has_circular):
+        if not (tasks_found or "circular" in matched):
             return False, "No assessment task or circular context"
         
-        # Identify which task(s) the paper addresses
-        tasks_found = []
-        if any(t.lower() in text for t in self.TASK_GEOMETRY):
-            tasks_found.append("geometry")
-        if any(t.lower() in text for t in self.TASK_STRENGTH):
-            tasks_found.append("strength")
-        if any(t.lower() in text for t in self.TASK_DETERIORATION):
-            tasks_found.append("deterioration")
-        if any(t.lower() in text for t in self.TASK_DEFECTS):
-            tasks_found.append("defects")
-        if any(t.lower() in text for t in self.TASK_MOISTURE):
-            tasks_found.append("moisture")
-        
         return True, f"Tasks: {', '.join(tasks_found) if tasks_found else 'circular'}"
     
     def search(
@@ -229,6 +333,8 @@ class RestrictedPaperSearcher:
         3. Requiring assessment tasks from paper
         4. Stricter exclusion criteria
         5. Limited pagination per search term
+        6. Matching terms in title/abstract only (title_and_abstract.search
+           filter, no fulltext relevance ranking)
         """
         print(f"\n{'='*60}")
         print("RESTRICTED SYSTEMATIC LITERATURE SEARCH")
@@ -236,111 +342,125 @@ class RestrictedPaperSearcher:
         print(f"Date Range: {start_year}-{end_year}")
         print(f"{'='*60}\n")
         
-        # EXPANDED search terms to reach ~612 papers
-        search_terms = [
+        # EXPANDED search terms to reach ~612 papers, grouped by assessment
+        # task; each group is sent as one OR query
+        search_terms = {
             # Task 1: Geometry verification - EXPANDED
-            '"reinforcement mapping" "ground penetrating radar"',
-            '"cover depth" concrete "non-destructive"',
-            '"rebar detection" ultrasonic',
-            '"geometry verification" structure',
-            '"GPR" "reinforced concrete"',
-            '"reinforcement detection" concrete',
-            '"section geometry" "non-destructive"',
-            '"cover depth measurement" concrete',
+            "geometry": [
+                '"reinforcement mapping" "ground penetrating radar"',
+                '"cover depth" concrete "non-destructive"',
+                '"rebar detection" ultrasonic',
+                '"geometry verification" structure',
+                '"GPR" "reinforced concrete"',
+                '"reinforcement detection" concrete',
+                '"section geometry" "non-destructive"',
+                '"cover depth measurement" concrete',
+            ],
             # Task 2: Strength estimation - EXPANDED
-            '"strength estimation" concrete',
-            '"rebound hammer" concrete strength',
-            '"compressive strength" "non-destructive" concrete',
-            '"sonreb" concrete',
-            '"pull-out test" concrete',
-            '"in-situ strength" concrete',
-            '"ultrasonic pulse velocity" strength concrete',
-            '"characteristic value" strength concrete',
-            '"schmidt hammer" concrete',
+            "strength": [
+                '"strength estimation" concrete',
+                '"rebound hammer" concrete strength',
+                '"compressive strength" "non-destructive" concrete',
+                '"sonreb" concrete',
+                '"pull-out test" concrete',
+                '"in-situ strength" concrete',
+                '"ultrasonic pulse velocity" strength concrete',
+                '"characteristic value" strength concrete',
+                '"schmidt hammer" concrete',
+            ],
             # Task 3: Deterioration assessment - EXPANDED
-            '"corrosion detection" "reinforced concrete"',
-            '"half-cell potential" corrosion',
-            '"carbonation depth" concrete',
-            '"chloride penetration" concrete',
-            '"corrosion assessment" concrete',
-            '"decay assessment" timber',
-            '"resistance drilling" timber',
-            '"degradation assessment" concrete',
-            '"corrosion rate" reinforcement',
-            '"service life" concrete NDT',
-            '"durability assessment" concrete',
+            "deterioration": [
+                '"corrosion detection" "reinforced concrete"',
+                '"half-cell potential" corrosion',
+                '"carbonation depth" concrete',
+                '"chloride penetration" concrete',
+                '"corrosion assessment" concrete',
+                '"decay assessment" timber',
+                '"resistance drilling" timber',
+                '"degradation assessment" concrete',
+                '"corrosion rate" reinforcement',
+                '"service life" concrete NDT',
+                '"durability assessment" concrete',
+            ],
             # Task 4: Defect identification - EXPANDED
-            '"crack detection" concrete',
-            '"delamination detection" concrete',
-            '"impact echo" concrete',
-            '"void detection" concrete',
-            '"defect detection" concrete',
-            '"flaw detection" steel',
-            '"ultrasonic testing" concrete defect',
-            '"internal damage" concrete',
-            '"hidden damage" structure',
-            '"damage detection" "non-destructive"',
+            "defects": [
+                '"crack detection" concrete',
+                '"delamination detection" concrete',
+                '"impact echo" concrete',
+                '"void detection" concrete',
+                '"defect detection" concrete',
+                '"flaw detection" steel',
+                '"ultrasonic testing" concrete defect',
+                '"internal damage" concrete',
+                '"hidden damage" structure',
+                '"damage detection" "non-destructive"',
+            ],
             # Task 5: Moisture condition - EXPANDED
-            '"moisture content" timber',
-            '"moisture measurement" building',
-            '"infrared thermography" moisture',
-            '"moisture assessment" concrete',
-            '"water ingress" building',
-            '"moisture meter" timber',
-            '"moisture distribution" concrete',
+            "moisture": [
+                '"moisture content" timber',
+                '"moisture measurement" building',
+                '"infrared thermography" moisture',
+                '"moisture assessment" concrete',
+                '"water ingress" building',
+                '"moisture meter" timber',
+                '"moisture distribution" concrete',
+            ],
             # Core NDT methods + structural materials
-            '"non-destructive testing" "reinforced concrete"',
-            '"non-destructive testing" "structural steel"',
-            '"non-destructive evaluation" concrete bridge',
-            '"ultrasonic pulse velocity" concrete structure',
-            '"ground penetrating radar" concrete structure',
-            '"infrared thermography" concrete building',
+            "ndt_methods": [
+                '"non-destructive testing" "reinforced concrete"',
+                '"non-destructive testing" "structural steel"',
+                '"non-destructive evaluation" concrete bridge',
+                '"ultrasonic pulse velocity" concrete structure',
+                '"ground penetrating radar" concrete structure',
+                '"infrared thermography" concrete building',
+            ],
             # Masonry and timber specific
-            '"masonry structure" "non-destructive"',
-            '"timber structure" "non-destructive"',
-            '"historic masonry" assessment',
-            '"heritage building" "non-destructive"',
-            '"flat-jack" masonry',
-            '"resistograph" timber',
+            "masonry_timber": [
+                '"masonry structure" "non-destructive"',
+                '"timber structure" "non-destructive"',
+                '"historic masonry" assessment',
+                '"heritage building" "non-destructive"',
+                '"flat-jack" masonry',
+                '"resistograph" timber',
+            ],
             # Circular construction and reuse
-            '"structural reuse" assessment',
-            '"circular construction" building',
-            '"existing building" assessment NDT',
-            '"condition assessment" existing structure',
-            '"reuse assessment" building',
-            '"building reuse" "non-destructive"',
-        ]
+            "circular": [
+                '"structural reuse" assessment',
+                '"circular construction" building',
+                '"existing building" assessment NDT',
+                '"condition assessment" existing structure',
+                '"reuse assessment" building',
+                '"building reuse" "non-destructive"',
+            ],
+        }
+        
+        base_filter = f"publication_year:{start_year}-{end_year},type:article"
         
         all_results = {}
+        seen_rejected = set()
         
-        for term in search_terms:
-            print(f"Searching: {term[:50]}...")
+        # One worker per query so every pagination chain advances at once;
+        # the session's PacedHTTPAdapter bounds how many requests are in flight
+        with ThreadPoolExecutor(max_workers=len(search_terms)) as executor:
+            # Each merged query keeps the page budget of the terms it replaces
+            futures = [
+                executor.submit(self._fetch_term, "|".join(terms), base_filter,
+                                max_pages_per_term * len(terms))
+                for terms in search_terms.values()
+            ]
             
-            params = {
-                "search": term,
-                "filter": f"publication_year:{start_year}-{end_year},type:article",
-                "per-page": 100,
-                "cursor": "*"
-            }
-            if self.email:
-                params["mailto"] = self.email
-            
-            term_count = 0
-            pages = 0
-            
-            while pages < max_pages_per_term:
-                try:
-                    response = requests.get(self.base_url, params=params)
-                    response.raise_for_status()
-                    data = response.json()
-                    
-                    results = data.get("results", [])
-                    if not results:
-                        break
-                    
+            # Consume in submission order so results (and BibTeX keys) stay
+            # deterministic while later queries are still being fetched
+            for (group, terms), future in zip(search_terms.items(), futures):
+                print(f"Searching: {group} ({len(terms)} terms)...")
+                term_count = 0
+                
+                for results in future.result():
                     for paper in results:
                         paper_id = paper.get("id", "")
-                        if paper_id in all_results:
+                        # Overlapping queries return the same works; skip them
+                        # before rebuilding the abstract again
+                        if paper_id in all_results or paper_id in seen_rejected:
                             continue
                         
                         paper_data = self._parse_paper(paper)
@@ -354,23 +474,13 @@ class RestrictedPaperSearcher:
                             all_results[paper_id] = paper_data
                             term_count += 1
                         else:
+                            seen_rejected.add(paper_id)
                             self.excluded.append({
                                 "title": paper_data.get("title", "")[:60],
                                 "reason": reason
                             })
-                    
-                    next_cursor = data.get("meta", {}).get("next_cursor")
-                    if not next_cursor:
-                        break
-                    params["cursor"] = next_cursor
-                    pages += 1
-                    time.sleep(0.1)
-                    
-                except requests.RequestException as e:
-                    print(f"  Error: {e}")
-                    break
-            
-            print(f"  → {term_count} added (total: {len(all_results)})")
+                
+                print(f"  → {term_count} added (total: {len(all_results)})")
         
         self.results = list(all_results.values())
         
@@ -382,6 +492,44 @@ class RestrictedPaperSearcher:
         
         return self.results
     
+    def _fetch_term(self, term: str, base_filter: str, max_pages: int) -> list:
+        """Fetch up to max_pages cursor-paginated result pages for one query."""
+        params = {
+            "filter": f"{base_filter},title_and_abstract.search:{term}",
+            "select": self.SELECT_FIELDS,
+            "per-page": 100,
+            "cursor": "*"
+        }
+        if self.email:
+            params["mailto"] = self.email
+        
+        pages = []
+        while len(pages) < max_pages:
+            try:
+                data = self._get_page(params)
+            except (requests.RequestException, orjson.JSONDecodeError) as e:
+                print(f"  Error ({term[:30]}...): {e}")
+                break
+            
+            results = data.get("results", [])
+            if not results:
+                break
+            pages.append(results)
+            
+            next_cursor = data.get("meta", {}).get("next_cursor")
+            if not next_cursor:
+                break
+            params["cursor"] = next_cursor
+        
+        return pages
+    
+    def _get_page(self, params: dict) -> dict:
+        """GET one page; cache misses are paced to the polite-pool rate by the adapter."""
+        response = self.session.get(self.base_url, params=params,
+                                    timeout=self.REQUEST_TIMEOUT)
+        response.raise_for_status()
+        return orjson.loads(response.content)
+    
     def _parse_paper(self, paper: dict) -> Optional[dict]:
         """Parse paper from OpenAlex."""
         try:
@@ -396,16 +544,9 @@ class RestrictedPaperSearcher:
             
             abstract = ""
             if paper.get("abstract_inverted_index"):
-                inv_idx = paper["abstract_inverted_index"]
-                if inv_idx:
-                    max_idx = max(max(indices) for indices in inv_idx.values())
-                    words = [""] * (max_idx + 1)
-                    for word, indices in inv_idx.items():
-                        for idx in indices:
-                            words[idx] = word
-                    abstract = " ".join(words)
+                abstract = self._reconstruct_abstract(paper["abstract_inverted_index"])
             
-            return {
+            paper_data = {
                 "title": paper.get("title", ""),
                 "authors": "; ".join(authors[:5]),
                 "year": paper.get("publication_year"),
@@ -418,37 +559,68 @@ class RestrictedPaperSearcher:
                 "url": paper.get("doi") or paper.get("id", ""),
                 "openalex_id": paper.get("id", "")
             }
+            # Lowercased once here and shared by is_relevant and the PRISMA stats
+            paper_data["_text_lc"] = f"{paper_data['title'] or ''} {abstract}".lower()
+            return paper_data
         except Exception:
             return None
     
+    @staticmethod
+    def _reconstruct_abstract(inv_idx: dict) -> str:
+        """Rebuild abstract text from OpenAlex's word -> positions index."""
+        # Positions are normally contiguous, so the total count sizes the list
+        # without a max() pre-scan; gaps or duplicates take the exact path
+        words = [""] * sum(map(len, inv_idx.values()))
+        try:
+            for word, indices in inv_idx.items():
+                for idx in indices:
+                    words[idx] = word
+        except IndexError:
+            words = None
+        
+        if not words or not words[-1]:
+            words = [""] * (max(map(max, inv_idx.values())) + 1)
+            for word, indices in inv_idx.items():
+                for idx in indices:
+                    words[idx] = word
+        return " ".join(words)
+    
     def export_to_csv(self, filename: str) -> str:
         if not self.results:
             return ""
-        df = pd.DataFrame(self.results)
-        df = df.sort_values(by=["year", "cited_by_count"], ascending=[False, False])
-        df.to_csv(filename, index=False, encoding="utf-8")
+        # Newest and most-cited first; papers missing a value sort last
+        rows = sorted(self.results, key=lambda p: (
+            p.get("year") is None, -(p.get("year") or 0),
+            p.get("cited_by_count") is None, -(p.get("cited_by_count") or 0),
+        ))
+        fields = [k for k in rows[0] if not k.startswith("_")]
+        with open(filename, "w", encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=fields, extrasaction="ignore",
+                                    lineterminator="\n")
+            writer.writeheader()
+            writer.writerows(rows)
         print(f"Exported: {filename}")
         return filename
     
     def export_to_bibtex(self, filename: str) -> str:
         if not self.results:
             return ""
-        entries = []
-        for i, paper in enumerate(self.results):
-            first_author = paper["authors"].split(";")[0].split()[-1] if paper["authors"] else "Unknown"
-            cite_key = f"{first_author}{paper['year']}_{i}"
-            cite_key = "".join(c for c in cite_key if c.isalnum() or c == "_")
-            title = paper['title'].replace('{', '\\{').replace('}', '\\}')
-            entry = f"""@article{{{cite_key},
+        # Entries are streamed to the file rather than collected and joined
+        with open(filename, "w", encoding="utf-8") as f:
+            for i, paper in enumerate(self.results):
+                first_author = paper["authors"].split(";", 1)[0].split()[-1] if paper["authors"] else "Unknown"
+                cite_key = f"{first_author}{paper['year']}_{i}"
+                cite_key = "".join(c for c in cite_key if c.isalnum() or c == "_")
+                title = paper['title'].translate(self.BIBTEX_ESCAPES)
+                if i:
+                    f.write("\n\n")
+                f.write(f"""@article{{{cite_key},
   title = {{{title}}},
   author = {{{paper['authors']}}},
   year = {{{paper['year']}}},
   journal = {{{paper['journal']}}},
   doi = {{{paper['doi']}}},
-}}"""
-            entries.append(entry)
-        with open(filename, "w", encoding="utf-8") as f:
-            f.write("\n\n".join(entries))
+}}""")
         print(f"BibTeX: {filename}")
         return filename
     
@@ -492,35 +664,23 @@ class RestrictedPaperSearcher:
             "records_identified": len(self.results) + len(self.excluded),
             "records_after_filtering": len(self.results),
             "excluded_count": len(self.excluded),
+            "by_exclusion_term": dict(Counter(self.exclusion_stats).most_common()),
             "by_assessment_task": task_counts,
-            "by_year": {},
-            "by_journal": {},
-            "by_material": {"concrete": 0, "steel": 0, "timber": 0, "masonry": 0},
+            "by_year": dict(Counter(p["year"] for p in self.results if p.get("year"))),
+            "by_journal": dict(Counter(
+                j for j in (p.get("journal", "Unknown") for p in self.results) if j
+            ).most_common(15)),
+            "by_material": dict.fromkeys(self.MATERIAL_TALLY, 0),
             "open_access": sum(1 for p in self.results if p.get("open_access")),
         }
         
         for paper in self.results:
-            year = paper.get("year")
-            if year:
-                stats["by_year"][year] = stats["by_year"].get(year, 0) + 1
-            
-            text = f"{paper.get('title', '')} {paper.get('abstract', '')}".lower()
-            if "concrete" in text:
-                stats["by_material"]["concrete"] += 1
-            if "steel" in text:
-                stats["by_material"]["steel"] += 1
-            if "timber" in text or "wood" in text:
-                stats["by_material"]["timber"] += 1
-            if "masonry" in text:
-                stats["by_material"]["masonry"] += 1
-        
-        for paper in self.results:
-            journal = paper.get("journal", "Unknown")
-            if journal:
-                stats["by_journal"][journal] = stats["by_journal"].get(journal, 0) + 1
-        
-        stats["by_journal"] = dict(sorted(stats["by_journal"].items(), 
-                                          key=lambda x: x[1], reverse=True)[:15])
+            text = paper["_text_lc"]
+            for material, words in self.MATERIAL_TALLY.items():
+                for word in words:
+                    if word in text:
+                        stats["by_material"][material] += 1
+                        break
         return stats
     
     def print_summary(self):
@@ -555,6 +715,16 @@ class RestrictedPaperSearcher:
             print(f"  {i+1}. {journal[:45]}: {count}")
 
 
+# Normalize keyword lists to lowercase tuples once, at import time
+for _attr in ("NDT_METHODS_CORE", "STRUCTURAL_MATERIALS", "ALL_ASSESSMENT_TASKS",
+              "CIRCULAR_STRICT", "EXCLUSION_STRICT", "TASK_GEOMETRY", "TASK_STRENGTH",
+              "TASK_DETERIORATION", "TASK_DEFECTS", "TASK_MOISTURE"):
+    setattr(RestrictedPaperSearcher, _attr,
+            tuple(kw.lower() for kw in getattr(RestrictedPaperSearcher, _attr)))
+for _task, _keywords in RestrictedPaperSearcher.TASK_CATEGORIES.items():
+    RestrictedPaperSearcher.TASK_CATEGORIES[_task] = tuple(kw.lower() for kw in _keywords)
+
+
 def main():
     print("""
     ╔══════════════════════════════════════════════════════════════╗
@@ -586,8 +756,9 @@ def main():
     searcher.export_to_bibtex("ndt_restricted_references.bib")
     
     stats = searcher.generate_prisma_stats()
-    with open("prisma_restricted_612.json", "w") as f:
-        json.dump(stats, f, indent=2)
+    with open("prisma_restricted_612.json", "wb") as f:
+        # by_year has int keys, which orjson only writes with OPT_NON_STR_KEYS
+        f.write(orjson.dumps(stats, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
     
     print("\nFiles saved (RESTRICTED - aligned with paper's five tasks):")
     print("  - ndt_restricted_612_results.csv")